@@ -131,7 +131,7 @@ build_prompt() {
   local result=""
   for p in "${PROMPTS[@]}"; do
     if [ -f "$p" ]; then
-      result="${result}$(cat "$p")"$'\n\n'
+      result="${result}$(<"$p")"$'\n\n'
     else
       result="${result}${p}"$'\n\n'
     fi
@@ -140,7 +140,7 @@ build_prompt() {
   # auto-inject human Q&A history if it exists
   if [ -f "$HUMAN_FILE" ]; then
     result="${result}# Human Q&A History"$'\n'
-    result="${result}$(cat "$HUMAN_FILE")"$'\n\n'
+    result="${result}$(<"$HUMAN_FILE")"$'\n\n'
   fi
 
   result="${result}${SIGNALS}"
@@ -257,7 +257,7 @@ while true; do
   esac
 
   EXIT_CODE=$?
-  OUTPUT=$(cat "$LOG_FILE")
+  OUTPUT=$(<"$LOG_FILE")
 
   ELAPSED=$(( $(date +%s) - START ))
 
@@ -288,7 +288,11 @@ while true; do
   fi
 
   # ── extract signals ─────────────────────────────────────────────────
-  UPDATES=$(extract_signals "update" "$OUTPUT")
+  # one fixed-string pass over the full log; tag matching below only
+  # sees the few lines that carry signals (-a: codex logs raw tool output,
+  # a stray NUL must not turn the log into "binary file matches")
+  SIGNAL_LINES=$(grep -aF "<loop:" "$LOG_FILE")
+  UPDATES=$(extract_signals "update" "$SIGNAL_LINES")
 
   echo "  round $ROUND · ${ELAPSED}s"
   while IFS= read -r line; do
@@ -296,30 +300,31 @@ while true; do
   done <<< "$UPDATES"
 
   # check <loop:done>
-  if echo "$OUTPUT" | grep -q "<loop:done"; then
-    SUMMARY=$(extract_signals "done" "$OUTPUT" | tail -1)
+  if [[ "$SIGNAL_LINES" == *"<loop:done"* ]]; then
+    SUMMARY=$(extract_signals "done" "$SIGNAL_LINES" | tail -1)
     echo "  ✓ done in $ROUND round(s)"
     [ -n "$SUMMARY" ] && echo "  ↳ $SUMMARY"
     break
   fi
 
   # check <loop:failed>
-  if echo "$OUTPUT" | grep -q "<loop:failed"; then
-    REASON=$(extract_signals "failed" "$OUTPUT" | tail -1)
+  if [[ "$SIGNAL_LINES" == *"<loop:failed"* ]]; then
+    REASON=$(extract_signals "failed" "$SIGNAL_LINES" | tail -1)
     echo "  ✗ agent reported failure at round $ROUND"
     [ -n "$REASON" ] && echo "  ↳ $REASON"
     exit 1
   fi
 
   # check <loop:human> — always log, optionally stop
-  if echo "$OUTPUT" | grep -q "<loop:human"; then
-    QUESTION=$(extract_signals "human" "$OUTPUT" | tail -1)
+  if [[ "$SIGNAL_LINES" == *"<loop:human"* ]]; then
+    QUESTION=$(extract_signals "human" "$SIGNAL_LINES" | tail -1)
     if [ -n "$QUESTION" ]; then
-      mkdir -p .pilot
-      echo "" >> "$HUMAN_FILE"
-      echo "## Round $ROUND" >> "$HUMAN_FILE"
-      echo "Q: $QUESTION" >> "$HUMAN_FILE"
-      echo "A: " >> "$HUMAN_FILE"
+      {
+        echo ""
+        echo "## Round $ROUND"
+        echo "Q: $QUESTION"
+        echo "A: "
+      } >> "$HUMAN_FILE"
       echo "  ? human input needed → $HUMAN_FILE"
       echo "  ↳ $QUESTION"
       if [ "$HUMAN_BLOCK" = "1" ]; then
@@ -14,37 +14,65 @@ Run from your project directory — mounts $(pwd) as /workspace.
 import hashlib
 import os
 import platform
-import signal
+import shutil
+import stat
 import subprocess
 import sys
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 DEFAULT_IMAGE = "pilot:latest"
 SCRIPT_DIR = Path(os.path.realpath(__file__)).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
+HOME = Path.home()
+DOCKER = shutil.which("docker") or "docker"
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or HOME / ".cache") / "pilot"
+ERR_SEC_ITEM_NOT_FOUND = 44  # `security` exit status for errSecItemNotFound
+CREDS_TTL = 600  # seconds a Keychain extraction is reused before asking `security` again
 
 
 # --- image ---
 
-def ensure_image(image: str, build: bool) -> int:
+def image_present(image: str) -> bool:
+    # same ref resolution as `docker run` (untagged → :latest, IDs, digests);
+    # --format keeps the reply to the image ID instead of the full JSON
+    result = subprocess.run(
+        [DOCKER, "image", "inspect", "--format", "{{.Id}}", image],
+        capture_output=True, check=False,
+    )
+    return result.returncode == 0
+
+
+def has_registry_host(image: str) -> bool:
+    # docker's rule: the first path component is a host if it has a "." or ":"
+    # or is "localhost" (ghcr.io/x/pilot, registry:5000/pilot, localhost/pilot)
+    head, sep, _ = image.partition("/")
+    return bool(sep) and ("." in head or ":" in head or head == "localhost")
+
+
+def ensure_image(image: str, build: bool, present: bool) -> int:
     if not build:
-        result = subprocess.run(
-            ["docker", "image", "inspect", image],
-            capture_output=True, check=False,
-        )
-        if result.returncode == 0:
+        if present:
             return 0
         print(f"image '{image}' not found, building...", file=sys.stderr)
 
     print(f"building image '{image}' from {PROJECT_ROOT}...", file=sys.stderr)
-    cmd = ["docker", "build",
+    cmd = [DOCKER, "build",
            "--build-arg", f"USER_UID={os.getuid()}",
            "-t", image]
     if build:
         cmd.append("--no-cache")
+    if has_registry_host(image):
+        # registry image: embed cache metadata for the push and reuse pushed layers.
+        # Local refs (pilot:latest, pilot:dev) skip both — no Docker Hub lookups.
+        cmd.extend(["--build-arg", "BUILDKIT_INLINE_CACHE=1"])
+        if not build:
+            cmd.extend(["--cache-from", image])
     cmd.append(str(PROJECT_ROOT))
-    rc = subprocess.run(cmd, check=False).returncode
+    env = {**os.environ, "DOCKER_BUILDKIT": "1"}
+    rc = subprocess.run(cmd, env=env, check=False).returncode
     if rc != 0:
         print("docker build failed", file=sys.stderr)
     return rc
@@ -54,9 +82,10 @@ def ensure_image(image: str, build: bool) -> int:
 
 def keychain_service_name(claude_home: Path) -> str:
     resolved = claude_home.expanduser().resolve()
-    default = Path.home() / ".claude"
+    default = HOME / ".claude"
     if resolved == default or resolved == default.resolve():
         return "Claude Code-credentials"
+    # must match the entry name Claude Code itself writes — keep sha256
     digest = hashlib.sha256(str(resolved).encode()).hexdigest()[:8]
     return f"Claude Code-credentials-{digest}"
 
@@ -68,6 +97,16 @@ def extract_macos_credentials(claude_home: Path):
         return None
 
     service = keychain_service_name(claude_home)
+    cache = CACHE_DIR / f"creds-{hashlib.blake2b(service.encode(), digest_size=8).hexdigest()}"
+    try:
+        if time.time() - cache.stat().st_mtime < CREDS_TTL:
+            print("using cached Claude credentials (from macOS Keychain)", file=sys.stderr)
+            return cache
+        # past CREDS_TTL: nothing removes the plaintext copy except the next run
+        # reaching this point, so drop it before asking the Keychain again
+        cache.unlink()
+    except OSError:
+        pass
 
     def _find():
         try:
@@ -75,66 +114,84 @@ def extract_macos_credentials(claude_home: Path):
                 ["security", "find-generic-password", "-s", service, "-w"],
                 capture_output=True, text=True, check=False,
             )
-            if r.returncode == 0 and r.stdout.strip():
-                return r.stdout.strip()
         except OSError:
-            pass
+            return None, None
+        if r.returncode == 0 and r.stdout.strip():
+            return r.returncode, r.stdout.strip()
+        return r.returncode, None
+
+    rc, creds = _find()
+    if rc == ERR_SEC_ITEM_NOT_FOUND:
+        # nothing stored for this config dir — unlocking would only prompt for nothing
         return None
-
-    creds = _find()
-    if not creds:
+    if not creds and rc is not None:
         print("unlocking macOS Keychain for Claude credentials...", file=sys.stderr)
         subprocess.run(["security", "unlock-keychain"], capture_output=True, check=False)
-        creds = _find()
+        rc, creds = _find()
 
     if not creds:
         return None
 
-    fd, tmp_path = tempfile.mkstemp()
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix=".creds-")  # 0600
+    except OSError:
+        return None
     try:
         with os.fdopen(fd, "w") as f:
             f.write(creds + "\n")
+        # atomic swap — a concurrent run never mounts a half-written file
+        os.replace(tmp_path, cache)
     except OSError:
         try:
             os.unlink(tmp_path)
         except OSError:
             pass
         return None
-    return Path(tmp_path)
+    print("extracted Claude credentials from macOS Keychain", file=sys.stderr)
+    return cache
 
 
 # --- volumes ---
 
-def build_volumes(creds_temp, claude_home):
-    home = Path.home()
-    pwd_env = os.environ.get("PWD")
-    cwd = Path(pwd_env) if pwd_env else Path(os.getcwd())
+def build_volumes(creds_file, claude_home, cwd):
     vols = []
 
     def add(src, dst, ro=False):
         suffix = ":ro" if ro else ""
         vols.extend(["-v", f"{src}:{dst}{suffix}"])
 
+    def source(path, want_dir):
+        # one stat per candidate; resolve only what will actually be mounted
+        try:
+            mode = os.stat(path).st_mode
+        except OSError:
+            return None
+        if want_dir and not stat.S_ISDIR(mode):
+            return None
+        return os.path.realpath(path)
+
     # claude config (read-only — init-docker.sh copies what's needed)
-    if claude_home.is_dir():
-        add(claude_home.resolve(), "/mnt/claude", ro=True)
+    src = source(claude_home, want_dir=True)
+    if src:
+        add(src, "/mnt/claude", ro=True)
 
     # workspace (read-write)
     add(cwd, "/workspace")
 
     # macOS keychain credentials
-    if creds_temp:
-        add(creds_temp, "/mnt/claude-credentials.json", ro=True)
+    if creds_file:
+        add(creds_file, "/mnt/claude-credentials.json", ro=True)
 
     # codex config (read-only)
-    codex_dir = home / ".codex"
-    if codex_dir.is_dir():
-        add(codex_dir.resolve(), "/mnt/codex", ro=True)
+    src = source(HOME / ".codex", want_dir=True)
+    if src:
+        add(src, "/mnt/codex", ro=True)
 
     # .gitconfig (read-only, git safe.directory handled via ENV in Dockerfile)
-    gitconfig = home / ".gitconfig"
-    if gitconfig.exists():
-        add(gitconfig.resolve(), "/home/pilot/.gitconfig", ro=True)
+    src = source(HOME / ".gitconfig", want_dir=False)
+    if src:
+        add(src, "/home/pilot/.gitconfig", ro=True)
 
     return vols
 
@@ -142,72 +199,61 @@ def build_volumes(creds_temp, claude_home):
 # --- run ---
 
 def run_docker(image, volumes, args):
-    cmd = ["docker", "run", "-t"]
-    if sys.stdin.isatty():
-        cmd.append("-i")
-    cmd.append("--rm")
-
-    for key in ("ANTHROPIC_API_KEY", "OPENAI_API_KEY"):
-        val = os.environ.get(key)
-        if val:
-            cmd.extend(["-e", f"{key}={val}"])
-
-    cmd.extend(volumes)
-    cmd.extend(["-w", "/workspace"])
-    cmd.extend([image, "pilot"])
-    cmd.extend(args)
-
-    proc = subprocess.Popen(cmd)
-    try:
-        proc.wait()
-    except KeyboardInterrupt:
-        try:
-            proc.terminate()
-        except ProcessLookupError:
-            pass
-        proc.wait()
-    return proc.returncode
+    env_flags = [
+        flag
+        for key in ("ANTHROPIC_API_KEY", "CLAUDE_CODE_OAUTH_TOKEN", "OPENAI_API_KEY")
+        if os.environ.get(key)
+        for flag in ("-e", f"{key}={os.environ[key]}")
+    ]
+    cmd = [
+        DOCKER, "run", "-t",
+        *(["-i"] if sys.stdin.isatty() else []),
+        "--rm",
+        *env_flags,
+        *volumes,
+        "-w", "/workspace",
+        image, "pilot",
+        *args,
+    ]
+
+    # nothing to clean up afterwards — replace this process so docker owns
+    # the terminal, signals and exit status directly
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execvp(cmd[0], cmd)
 
 
 # --- main ---
 
 def main():
     image = os.environ.get("PILOT_IMAGE", DEFAULT_IMAGE)
-    args = sys.argv[1:]
-
-    build = "--build" in args
-    if build:
-        args = [a for a in args if a != "--build"]
-
-    rc = ensure_image(image, build)
-    if rc != 0:
-        return rc
+    build = False
+    args = []
+    for a in sys.argv[1:]:
+        if a == "--build":
+            build = True
+        else:
+            args.append(a)
 
     claude_config = os.environ.get("CLAUDE_CONFIG_DIR")
-    claude_home = Path(claude_config).expanduser().resolve() if claude_config else Path.home() / ".claude"
-
-    creds_temp = extract_macos_credentials(claude_home)
-    if creds_temp:
-        print("extracted Claude credentials from macOS Keychain", file=sys.stderr)
+    claude_home = Path(claude_config).expanduser().resolve() if claude_config else HOME / ".claude"
 
-    def cleanup():
-        if creds_temp:
-            try:
-                creds_temp.unlink(missing_ok=True)
-            except OSError:
-                pass
+    # forwarded API key / OAuth token already authenticates claude in the container
+    env_auth = any(os.environ.get(k) for k in ("ANTHROPIC_API_KEY", "CLAUDE_CODE_OAUTH_TOKEN"))
 
-    def term_handler(signum, frame):
-        cleanup()
-        sys.exit(128 + signum)
+    # image check and Keychain lookup both just wait on a subprocess — overlap them;
+    # a build (if needed) still runs afterwards so its output can't interleave a prompt
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        present = pool.submit(image_present, image) if not build else None
+        creds_file = None if env_auth else extract_macos_credentials(claude_home)
 
-    signal.signal(signal.SIGTERM, term_handler)
+    rc = ensure_image(image, build, present is not None and present.result())
+    if rc != 0:
+        return rc
 
-    try:
-        volumes = build_volumes(creds_temp, claude_home)
-        return run_docker(image, volumes, args)
-    finally:
-        cleanup()
+    cwd = Path(os.environ.get("PWD") or os.getcwd())
+    volumes = build_volumes(creds_file, claude_home, cwd)
+    run_docker(image, volumes, args)
 
 
 if __name__ == "__main__":